@@ -28,13 +28,6 @@ class Colors:
     WHITE = 0xC0C0C0
     OUTLINE = GRAY_DK
 
-    black_palette = displayio.Palette(1)
-    black_palette[0] = BLACK
-    gray_palette = displayio.Palette(1)
-    gray_palette[0] = GRAY
-    gray_dk_palette = displayio.Palette(1)
-    gray_dk_palette[0] = GRAY_DK
-
 
 # (x, y), (width, height), name, fill_color, outline_color, pressed_color
 # object order: back to front
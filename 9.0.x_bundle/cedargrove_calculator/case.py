@@ -72,7 +72,11 @@ class LEDDisplay(displayio.Group):
 
     @text.setter
     def text(self, text=""):
-        self._led_digits.text = text[0:15]
+        if len(text) > 15:
+            text = text[0:15]
+        # Skip the label rebuild if the displayed text is unchanged
+        if text != self._led_digits.text:
+            self._led_digits.text = text
         return
 
 
@@ -17,23 +17,7 @@ import displayio
 from adafruit_bitmap_font import bitmap_font
 from adafruit_button import Button
 from simpleio import tone
-
-
-class Colors:
-    BLACK = 0x000000
-    BLUE = 0x4040F0
-    GRAY = 0x202020
-    GRAY_DK = 0x101010
-    RED = 0xFF0000
-    WHITE = 0xC0C0C0
-    OUTLINE = GRAY_DK
-
-    black_palette = displayio.Palette(1)
-    black_palette[0] = BLACK
-    gray_palette = displayio.Palette(1)
-    gray_palette[0] = GRAY
-    gray_dk_palette = displayio.Palette(1)
-    gray_dk_palette[0] = GRAY_DK
+from cedargrove_calculator.colors import Colors
 
 
 # (x, y), (width, height), name, fill_color, outline_color, pressed_color
@@ -78,8 +62,11 @@ HP_BUTTONS = [
 
 
 class CalculatorButtons(displayio.Group):
-    def __init__(self, l_margin=0, timeout=1.0, click=True,  display=None, touch=None):
-        """Instantiate on-screen buttons and build button_group."""
+    def __init__(
+        self, l_margin=0, timeout=1.0, click=True, display=None, touch=None, font=None
+    ):
+        """Instantiate on-screen buttons and build button_group. Loads the label
+        font unless an already loaded font is provided."""
 
         self._timeout = timeout
         self._click = click
@@ -89,14 +76,14 @@ class CalculatorButtons(displayio.Group):
         HEIGHT = display.height
         SIZE_FACTOR = 1.2
 
-        # Create a list of button names for button creation
-        self._button_names = [name[2] for name in HP_BUTTONS]
-
-        self.FONT_0 = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
+        if font:
+            self.FONT_0 = font
+        else:
+            self.FONT_0 = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
 
         # Build displayio button group
-        self._buttons = []
-        self._buttons_index = []  # The list of buttons used for detection
+        self._buttons = []  # The list of buttons used for detection
+        self._hit_boxes = []  # Button (x_min, y_min, x_max, y_max) touch bounds
         button_group = displayio.Group()
 
         # Create the displayio button definitions
@@ -120,7 +107,14 @@ class CalculatorButtons(displayio.Group):
                 button.label_color = Colors.BLACK
             button_group.append(button)
             self._buttons.append(button)
-            self._buttons_index.append(button.name)
+            self._hit_boxes.append(
+                (
+                    button.x,
+                    button.y,
+                    button.x + button.width,
+                    button.y + button.height,
+                )
+            )
 
         super().__init__()
         self.append(button_group)
@@ -145,18 +139,21 @@ class CalculatorButtons(displayio.Group):
     def read_buttons(self):
         button_pressed = button_name = None
         hold_time = 0
-        touch = self.ts.points
+        # Check the touch count register before reading the point data
+        touch = self.ts.points if self.ts.touched else None
         if touch:
-            for button in self._buttons:
-                if button.contains(touch[0]):  # read only the first point touched
+            x, y = touch[0][0], touch[0][1]  # read only the first point touched
+            for index, (x_min, y_min, x_max, y_max) in enumerate(self._hit_boxes):
+                if x_min <= x <= x_max and y_min <= y <= y_max:
+                    button = self._buttons[index]
                     button.selected = True
                     if self._click:
                         # Make a click sound when button is pressed
                         tone(board.A0, 3000, 0.001, length=8)
                     button_pressed = button.name
-                    button_name = self._buttons_index.index(button_pressed)
+                    button_name = index
                     timeout_beep = False
-                    while self.ts.points:
+                    while self.ts.touched:  # Touch count register; no point data read
                         time.sleep(0.1)
                         hold_time += 0.1
                         if hold_time >= self._timeout and not timeout_beep:
@@ -168,4 +165,5 @@ class CalculatorButtons(displayio.Group):
                     if self._click:
                         # Make a click sound when button is released
                         tone(board.A0, 3000, 0.001, length=8)
+                    break  # Buttons don't overlap; skip the rest of the scan
         return button_pressed, button_name, hold_time
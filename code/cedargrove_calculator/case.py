@@ -13,21 +13,8 @@ Calculator case graphics classes.
 import displayio
 import vectorio
 from adafruit_bitmap_font import bitmap_font
-from adafruit_display_text.label import Label
-
-
-class Colors:
-    BLACK = 0x000000
-    BLUE = 0x606060
-    GRAY = 0x202020
-    GRAY_DK = 0x101010
-
-    black_palette = displayio.Palette(1)
-    black_palette[0] = BLACK
-    gray_palette = displayio.Palette(1)
-    gray_palette[0] = GRAY
-    gray_dk_palette = displayio.Palette(1)
-    gray_dk_palette[0] = GRAY_DK
+from adafruit_display_text.bitmap_label import Label
+from cedargrove_calculator.colors import Colors
 
 
 # (x, y), (width, height), name, fill_color
@@ -72,7 +59,11 @@ class LEDDisplay(displayio.Group):
 
     @text.setter
     def text(self, text=""):
-        self._led_digits.text = text[0:15]
+        if len(text) > 15:
+            text = text[0:15]
+        # Skip the label rebuild if the displayed text is unchanged
+        if text != self._led_digits.text:
+            self._led_digits.text = text
         return
 
 
@@ -81,24 +72,20 @@ class CalculatorCase(displayio.Group):
         """Instantiate case graphic and build case group."""
         self._l_margin = HP_CASE[0][0][0]
 
-        FONT_1 = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
+        self._font = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
 
         # Build displayio case group
         case_group = displayio.Group()
 
-        for part in HP_CASE:
+        for (x, y), (width, height), _, palette in HP_CASE:
             case_part = vectorio.Rectangle(
-                pixel_shader=part[3],
-                x=part[0][0],
-                y=part[0][1],
-                width=part[1][0],
-                height=part[1][1],
+                pixel_shader=palette, x=x, y=y, width=width, height=height
             )
             case_group.append(case_part)
 
         # Status message area
         self._status = Label(
-            font=FONT_1,
+            font=self._font,
             text="",
             color=None,
         )
@@ -108,9 +95,10 @@ class CalculatorCase(displayio.Group):
 
         # Power switch label
         pwr_text = Label(
-            font=FONT_1,
+            font=self._font,
             text="OFF" + (" " * 14) + "ON" + (" " * 26) + "CG-35",
             color=Colors.BLACK,
+            save_text=False,
         )
         pwr_text.anchor_point = (0, 0)
         pwr_text.anchored_position = (61, HP_CASE[2][0][1])
@@ -120,6 +108,11 @@ class CalculatorCase(displayio.Group):
         self.append(case_group)
         return
 
+    @property
+    def font(self):
+        """Case label font; shared with the button labels."""
+        return self._font
+
     @property
     def l_margin(self):
         """Left margin spacing in pixels."""
@@ -127,10 +120,12 @@ class CalculatorCase(displayio.Group):
 
     @property
     def status(self):
-        """Status message text."""
+        """Status message label."""
         return self._status
 
     @status.setter
     def status(self, text=""):
-        self._status = text
+        """Set the status message label text."""
+        if text != self._status.text:
+            self._status.text = text
         return
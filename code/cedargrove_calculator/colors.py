@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2022, 2024 JG for Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+"""
+cedargrove_calculator.colors.py  2024-04-14 v2.2
+For the ESP32-S3 4Mb/2Mb Feather and 3.5-inch TFT Capacitive FeatherWing
+================================================
+
+Calculator colors and shared displayio palettes.
+
+"""
+
+import displayio
+
+
+class Colors:
+    BLACK = 0x000000
+    BLUE = 0x4040F0
+    GRAY = 0x202020
+    GRAY_DK = 0x101010
+    GRAY_LT = 0x606060
+    RED = 0xFF0000
+    WHITE = 0xC0C0C0
+    OUTLINE = GRAY_DK
+
+    black_palette = displayio.Palette(1)
+    black_palette[0] = BLACK
+    gray_palette = displayio.Palette(1)
+    gray_palette[0] = GRAY
+    gray_dk_palette = displayio.Palette(1)
+    gray_dk_palette[0] = GRAY_DK
@@ -58,6 +58,7 @@ Optional/future features:
 """
 
 import board
+import busio
 import displayio
 import time
 import gc
@@ -67,15 +68,18 @@ from simpleio import tone
 # import digitalio
 
 from cedargrove_calculator.buttons import CalculatorButtons
-from cedargrove_calculator.case import CalculatorCase, LEDDisplay, Colors
-from jepler_udecimal import Decimal, getcontext, setcontext, localcontext, ROUND_HALF_UP
-import jepler_udecimal.utrig  # Needed for trig functions in Decimal
+from cedargrove_calculator.case import CalculatorCase, LEDDisplay
+from cedargrove_calculator.colors import Colors
+from jepler_udecimal import Decimal, getcontext, localcontext, ROUND_HALF_UP
 
 # User-modifiable parameters
 DISPLAY_PRECISION = 10
 INTERNAL_PRECISION = 20
+TOUCH_POLL_INTERVAL = 0.02  # Idle touchscreen polling interval in seconds
+TOUCH_I2C_FREQUENCY = 400000  # Touch panel I2C clock (Hz); FT5336 supports 400kHz
+GC_THRESHOLD = 20000  # Collect heap garbage when free memory falls below (bytes)
 
-DEBUG = False  # Turns on debug print ('printd()')function
+DEBUG = False  # Turns on debug print ('printd()') function and stack/frame REPL output
 
 # Calculator states
 IDLE = "IDLE"  # Waiting for input or displaying results
@@ -88,8 +92,47 @@ ERROR = "ERROR"  # Calculation error
 
 STATE = IDLE  # Set initial state to IDLE
 
+# Digit entry keys: 0-9, .
+DIGIT_KEYS = {"0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "."}
+
+# Key cluster lookup table; maps a key name to its cluster's calculator state
+KEY_CLUSTERS = {}
+KEY_CLUSTERS.update(dict.fromkeys(DIGIT_KEYS, C_ENTRY))
+KEY_CLUSTERS.update(dict.fromkeys(("CHS", "EEX"), C_ENTRY))
+KEY_CLUSTERS.update(
+    dict.fromkeys(("ENTER", "CLR", "CLX", "STO", "RCL", "R", "x<>y", "π"), STACK)
+)
+KEY_CLUSTERS.update(
+    dict.fromkeys(
+        ("LOG", "LN", "e^x", "√x", "ARC", "SIN", "COS", "TAN", "1/x"), MONADIC
+    )
+)
+KEY_CLUSTERS.update(dict.fromkeys(("x^y", "-", "+", "*", "÷"), DYADIC))
+
+# Monadic operator key functions of X_REG; Decimal methods are looked up once
+MONADIC_FUNCTIONS = {
+    "LOG": Decimal.log10,
+    "LN": Decimal.ln,
+    "e^x": Decimal.exp,
+    "√x": Decimal.sqrt,
+    "1/x": lambda value: 1 / value,
+}
+
+# Trigonometric key functions; (function, ARC function). Loaded with the
+# jepler_udecimal.utrig module when the first trig key is pressed.
+TRIG_FUNCTIONS = None
+
+# Dyadic operator key functions of (Y_REG, X_REG); the stack is pulled afterwards
+DYADIC_FUNCTIONS = {
+    "-": Decimal.__sub__,
+    "+": Decimal.__add__,
+    "*": Decimal.__mul__,
+    "÷": Decimal.__truediv__,
+}
+
 # Constants
-PI = Decimal(1).atan() * 4  # Alternative: PI = Decimal("3.141592654")
+ZERO = Decimal("0")
+PI = Decimal("3.141592653589793238462643383")  # Decimal(1).atan() * 4
 
 t0 = time.monotonic()  # Reset start-up time counter
 gc.collect()  # Clean-up memory heap space
@@ -105,15 +148,21 @@ tft_bus = displayio.FourWire(
 tft = adafruit_hx8357.HX8357(tft_bus, width=480, height=320)
 tft.rotation = 270
 
-# Capacitive touch panel
-cts = adafruit_ft5336.Adafruit_FT5336(board.I2C())
+# Capacitive touch panel; only the first touch point is used for buttons
+i2c = busio.I2C(board.SCL, board.SDA, frequency=TOUCH_I2C_FREQUENCY)
+cts = adafruit_ft5336.Adafruit_FT5336(i2c, max_touches=1)
 
 # tft.brightness = 1  # 0.55 for camera image
 
 # Instantiate case group and buttons class
 case_group = CalculatorCase(display=tft)
 buttons = CalculatorButtons(
-    l_margin=case_group.l_margin, timeout=10, click=True, display=tft, touch=cts
+    l_margin=case_group.l_margin,
+    timeout=10,
+    click=True,
+    display=tft,
+    touch=cts,
+    font=case_group.font,  # Share the case font; avoids loading the BDF twice
 )
 led_display = LEDDisplay(scale=1, display=tft)
 
@@ -125,10 +174,19 @@ getcontext().Emax = 99
 getcontext().Emin = -99
 # getcontext().rounding = ROUND_HALF_UP
 
+# Full circle in radians for degree conversions; calculated once at the
+# internal precision
+TWO_PI = PI * 2
+
 # Initiate the display, memory, and stack
 DISPLAY_C = " 0."
 DISPLAY_E = " 00"
-X_REG = Y_REG = Z_REG = T_REG = MEM = Decimal("0")
+X_REG = Y_REG = Z_REG = T_REG = MEM = ZERO
+
+# The last X_REG value shown and its display text; Decimal values are immutable
+# so an unchanged X_REG object doesn't need to be converted again
+LAST_X_REG = ZERO
+LAST_DISPLAY = (" 0.", "   ")
 
 # Add the case, bubble display, and button displayio layers
 calculator.append(case_group)
@@ -141,10 +199,11 @@ calculator.append(displayio.TileGrid(hp35_image, pixel_shader=hp35_image.pixel_s
 
 tft.root_group = calculator
 
-def printd(line):
-    """Debug print function. Use formatted print statements."""
+def printd(line, *args):
+    """Debug print function. Pass a str.format() template and its arguments;
+    the line is only formatted when DEBUG is enabled."""
     if DEBUG:
-        print(line)
+        print(line.format(*args))
     return
 
 
@@ -155,61 +214,67 @@ def clr(register=None):
         # Clear display, stack registers, memory, and reset ARC flag
         DISPLAY_C = " 0."
         DISPLAY_E = " 00"
-        X_REG = Y_REG = Z_REG = T_REG = MEM = Decimal("0")
+        X_REG = Y_REG = Z_REG = T_REG = MEM = ZERO
         ARC_FLAG = False
     elif register == "x":
         # Clear display and X_REG
         DISPLAY_C = " 0."
         DISPLAY_E = " 00"
-        X_REG = Decimal("0")
+        X_REG = ZERO
     else:
         return False  # No register specified
     return True
 
 
+def load_trig_functions():
+    """Import the Decimal trig functions and build the trig key function table.
+    Deferred until first use to save memory when trig keys aren't used."""
+    global TRIG_FUNCTIONS
+    import jepler_udecimal.utrig  # Adds the trig functions to Decimal
+
+    TRIG_FUNCTIONS = {
+        "SIN": (Decimal.sin, Decimal.asin),
+        "COS": (Decimal.cos, Decimal.acos),
+        "TAN": (Decimal.tan, Decimal.atan),
+    }
+    return
+
+
 def get_key():
     """Get pressed key name. This is a blocking method (for now)."""
     key_name = None
     while not key_name:
         key_name, _, hold_time = buttons.read_buttons()
-    printd(f"get_key: name:{key_name:5s} hold_time:{hold_time:5.3f}s")
+        if not key_name:
+            time.sleep(TOUCH_POLL_INTERVAL)  # Idle; pace the touch panel reads
+    printd("get_key: name:{:5s} hold_time:{:5.3f}s", key_name, hold_time)
     return key_name
 
 
 def push_stack():
     """Push stack values; T_REG is lost."""
-    global X_REG, Y_REG, Z_REG, T_REG
-    T_REG = Z_REG
-    Z_REG = Y_REG
-    Y_REG = X_REG
+    global Y_REG, Z_REG, T_REG
+    T_REG, Z_REG, Y_REG = Z_REG, Y_REG, X_REG
     return
 
 
 def pull_stack():
     """Pull (drop) stack values; place "0" into T_REG."""
     global X_REG, Y_REG, Z_REG, T_REG
-    X_REG = Y_REG
-    Y_REG = Z_REG
-    Z_REG = T_REG
-    T_REG = Decimal("0")
+    X_REG, Y_REG, Z_REG, T_REG = Y_REG, Z_REG, T_REG, ZERO
     return
 
 
 def roll_stack():
     """Roll stack values; place X_REG into T_REG."""
     global X_REG, Y_REG, Z_REG, T_REG
-    temp = X_REG
-    X_REG = Y_REG
-    Y_REG = Z_REG
-    Z_REG = T_REG
-    T_REG = temp
+    X_REG, Y_REG, Z_REG, T_REG = Y_REG, Z_REG, T_REG, X_REG
     return
 
 
 def convert_display_to_decimal(coefficient=" 0.", exponent="   "):
     """Convert display text to an equivalent Decimal value."""
-    printd(f"display_to_decimal input: '{coefficient}'  '{exponent}'")
-    getcontext().prec = DISPLAY_PRECISION
+    printd("display_to_decimal input: '{}'  '{}'", coefficient, exponent)
     sign = coefficient[0]
     coefficient = coefficient[1:12]
     exponent = exponent[0:3]
@@ -219,43 +284,41 @@ def convert_display_to_decimal(coefficient=" 0.", exponent="   "):
         sign = "+"
 
     # Clean up and reformat coefficient; remove spaces, put zero before dp if dp is in first position
-    while coefficient.find(" ") >= 0:
-        coefficient = coefficient.split(" ", 1)[0] + coefficient.split(" ", 1)[1]
+    coefficient = coefficient.replace(" ", "")
     if coefficient[0] == ".":
         coefficient = "0" + coefficient
     # Pad coefficient with trailing zeros for values with positive exponent
-    for i in range(len(coefficient), getcontext().prec + 1):
+    for i in range(len(coefficient), DISPLAY_PRECISION + 1):
         coefficient = coefficient + "0"
     # Clean up and reformat exponent; remove spaces, set to zero if blank, add separator E character
-    while exponent.find(" ") >= 0:
-        exponent = exponent.split(" ", 1)[0] + exponent.split(" ", 1)[1]
+    exponent = exponent.replace(" ", "")
     if exponent == "":
         exponent = "0"
     exponent = "E" + str(int(exponent))
     # Reconstruct the value as Decimal type
     new_value = Decimal(sign + coefficient + exponent)
 
-    # Set display precision and return value
-    getcontext().prec = INTERNAL_PRECISION
+    # Round to internal precision and return value
     new_value = new_value / 1
-    printd(f"display_to_decimal: new_value out: '{new_value}'")
+    printd("display_to_decimal: new_value out: '{}'", new_value)
     return new_value
 
 
-def convert_decimal_to_display(value=Decimal("0")):
+def convert_decimal_to_display(value=ZERO):
     """Convert a Decimal value into the equivalent display text."""
     # Round to display precision and convert to string
-    printd(f"decimal_to_display value input: '{value}'  type: {type(value)}")
+    printd("decimal_to_display value input: '{}'  type: {}", value, type(value))
     if value.is_finite():
-        value = value / 1
-        getcontext().prec = DISPLAY_PRECISION
-        value = value / 1
+        with localcontext() as ctx:
+            ctx.prec = DISPLAY_PRECISION
+            value = value / 1
     else:
-        value = Decimal(0)
+        value = ZERO
     decimal_text = str(value)
 
     # Separate coefficient from exponent
-    if decimal_text.find("E") >= 0:
+    has_exponent = "E" in decimal_text
+    if has_exponent:
         coefficient, exponent = decimal_text.split("E", 1)
     else:
         coefficient = decimal_text
@@ -272,38 +335,35 @@ def convert_decimal_to_display(value=Decimal("0")):
         exponent = "- " + exponent[-1]
 
     # If no decimal point in coefficient, add one to the end
-    if coefficient.find(".") < 0 and len(coefficient) < 12:
+    if "." not in coefficient and len(coefficient) < 12:
         coefficient = coefficient + "."
 
     # Remove trailing zeros from coefficient
-    while coefficient.find(".") <= 12 and coefficient[-1] == "0":
-        coefficient = coefficient[0:-1]
+    if "." in coefficient:
+        coefficient = coefficient.rstrip("0")
 
     # Remove leading zeros except at start of digit entry
-    if coefficient[1:] != "0.":
-        while coefficient.find(".") > 1 and coefficient[1] == "0":
-            coefficient = coefficient[0] + coefficient[2:]
+    if coefficient[1:] != "0." and "." in coefficient:
+        coefficient = coefficient[0] + coefficient[1:].lstrip("0")
 
     # Don't display a minus zero coefficient
     if coefficient == "-0.":
         coefficient = " 0."
 
     # If no exponent separator or coefficient is zero, blank the exponent value
-    if decimal_text.find("E") < 0 or coefficient[1:] == "0.":
+    if not has_exponent or coefficient[1:] == "0.":
         exponent = "   "
 
-    getcontext().prec = INTERNAL_PRECISION
-    printd(f"**** coefficient '{coefficient}', exponent '{exponent}'")
-    printd(f"     len(coefficient):{len(coefficient)}, len(exponent):{len(exponent)}")
+    printd("**** coefficient '{}', exponent '{}'", coefficient, exponent)
+    printd("     len(coefficient):{}, len(exponent):{}", len(coefficient), len(exponent))
     return coefficient, exponent
 
 
 def print_stack():
     """Print stack registers and auxiliary memory in REPL."""
+    coefficient, exponent = convert_decimal_to_display(X_REG)
     print(f"-" * 48)
-    print(
-        f"D.X_REG:  {X_REG}  DISPLAY: '{convert_decimal_to_display(X_REG)[0] + convert_decimal_to_display(X_REG)[1]}'"
-    )
+    print(f"D.X_REG:  {X_REG}  DISPLAY: '{coefficient + exponent}'")
     print(f"D.Y_REG:  {Y_REG}")
     print(f"D.Z_REG:  {Z_REG}")
     print(f"D.T_REG:  {T_REG}")
@@ -320,8 +380,7 @@ def show_display_reg():
     if exponent[1:3] == "00":
         exponent = "   "
     # If needed, pad coefficient with spaces
-    coefficient = coefficient + (" " * (12 - len(coefficient)))
-    led_display.text = coefficient + exponent
+    led_display.text = "{:<12}{}".format(coefficient, exponent)
     return
 
 
@@ -343,43 +402,48 @@ def display_error(text=""):
 def display_status(text="", duration=0.5):
     """Display message in status area for duration in seconds or None to hold
     text in status message area."""
-    case_group.status.text = text
-    case_group.status.color = Colors.BLUE
+    status = case_group.status
+    # Only write changed label attributes; each write redraws the label
+    if status.text != text:
+        status.text = text
+    if text and status.color != Colors.GRAY_LT:
+        # An empty message is invisible in any color
+        status.color = Colors.GRAY_LT
     if duration:
         time.sleep(duration)
-        case_group.status.color = None
+        status.color = None
     return
 
 
 def update_x_reg_from_display_reg():
     """Move DISPLAY registers' content to the X_REG."""
-    global X_REG, DISPLAY_C, DISPLAY_E
-    if DISPLAY_E == "-00":
-        DISPLAY_E = " 00"
+    global X_REG
     X_REG = convert_display_to_decimal(DISPLAY_C, DISPLAY_E)
     return
 
 
 def update_display_reg_from_x_reg():
     """Update the LED display with X_REG value."""
-    global X_REG, DISPLAY_C, DISPLAY_E
-    coefficient, exponent = convert_decimal_to_display(X_REG)
+    global X_REG, DISPLAY_C, DISPLAY_E, LAST_X_REG, LAST_DISPLAY
+    if X_REG is not LAST_X_REG:
+        LAST_X_REG = X_REG
+        LAST_DISPLAY = convert_decimal_to_display(X_REG)
+    coefficient, exponent = LAST_DISPLAY
     DISPLAY_C = coefficient
     DISPLAY_E = exponent
     # If needed, pad coefficient with spaces
-    coefficient = coefficient + (" " * (12 - len(coefficient)))
-    led_display.text = coefficient + exponent
+    led_display.text = "{:<12}{}".format(coefficient, exponent)
     return
 
 
 def convert_degrees_to_radians(value):
     """Convert Decimal degrees value to radians."""
-    return (value % 360) * (PI * 2) / 360
+    return (value % 360) * TWO_PI / 360
 
 
 def convert_radians_to_degrees(value):
     """Convert Decimal radians value to degrees."""
-    return (value % (PI * 2)) * 360 / (PI * 2)
+    return (value % TWO_PI) * 360 / TWO_PI
 
 
 time.sleep(5)  # Hold the HP35 image on-screen for a bit
@@ -402,24 +466,21 @@ while True:
 
     key_name = get_key()  # Wait for key press
     display_status("", 0)  # Clear any status messages
+    key_cluster = KEY_CLUSTERS.get(key_name)
+
+    # Refresh the display unless the key leaves X_REG unchanged; the first key
+    # after digit entry or an error always refreshes the display
+    refresh_display = True
+    display_stale = STATE in (C_ENTRY, E_ENTRY, ERROR)
+
+    # Move the entered number into X_REG once digit entry is finished
+    if key_cluster != C_ENTRY and STATE in (C_ENTRY, E_ENTRY):
+        update_x_reg_from_display_reg()
 
     # Display Entry Keys Cluster: 0-9, ., CHS, EEX
-    if key_name in (
-        "0",
-        "1",
-        "2",
-        "3",
-        "4",
-        "5",
-        "6",
-        "7",
-        "8",
-        "9",
-        ".",
-        "CHS",
-        "EEX",
-    ):
-        printd(f"Display entry key: {key_name}")
+    if key_cluster == C_ENTRY:
+        printd("Display entry key: {}", key_name)
+        digit_key = key_name in DIGIT_KEYS
         if "ENTRY" not in STATE:
             # Prepare for digit entry when previous operation has finished
             if STATE == DYADIC:
@@ -433,30 +494,28 @@ while True:
             (STATE == C_ENTRY)
             and (STATE != E_ENTRY)
             and len(DISPLAY_C) < 12
-            and (key_name not in ("CHS", "EEX"))
+            and digit_key
         ):
-            getcontext().prec = DISPLAY_PRECISION
-            if DISPLAY_C[1:] == "0." and key_name == ".":
+            if DISPLAY_C in (" 0.", "-0."):
                 # First digit entry
-                dp_flag = True
-                DISPLAY_C = DISPLAY_C.replace("0.", key_name)
-            elif DISPLAY_C[1:] == "0.":
-                DISPLAY_C = DISPLAY_C.replace("0", key_name)
+                if key_name == ".":
+                    dp_flag = True
+                    DISPLAY_C = DISPLAY_C[0] + "."
+                else:
+                    DISPLAY_C = DISPLAY_C[0] + key_name + "."
             else:
-                dp_index = DISPLAY_C.index(".")
                 if key_name != ".":
                     if dp_flag:
                         # Fractional portion of coefficient (right of decimal separator)
                         DISPLAY_C = DISPLAY_C + key_name
                     else:
-                        # Integer portion of coefficient (left of decimal separator)
-                        DISPLAY_C = (
-                            DISPLAY_C[0:dp_index] + key_name + DISPLAY_C[dp_index:]
-                        )
+                        # Integer portion of coefficient (left of decimal separator);
+                        #   the decimal separator is always last until it's keyed
+                        DISPLAY_C = DISPLAY_C[:-1] + key_name + "."
                 else:
                     dp_flag = True
 
-        if (STATE == E_ENTRY) and (key_name not in ("CHS", "EEX")):
+        if (STATE == E_ENTRY) and digit_key:
             # First digit entry
             if DISPLAY_E[1:3] == "00":
                 DISPLAY_E = DISPLAY_E[0:2] + key_name
@@ -481,88 +540,55 @@ while True:
         if key_name == "EEX":
             STATE = E_ENTRY
 
+        # Drop the sign from a zero exponent
+        if DISPLAY_E == "-00":
+            DISPLAY_E = " 00"
+
         show_display_reg()
-        update_x_reg_from_display_reg()
 
     # Stack Management and Constant Key Cluster: ENTER, CLR, CLX, STO, RCL, R, x<>y, π
-    if key_name in (
-        "ENTER",
-        "CLR",
-        "CLX",
-        "STO",
-        "RCL",
-        "R",
-        "x<>y",
-        "π",
-    ):
+    if key_cluster == STACK:
         STATE = STACK
-        printd(f"stack management and constant key: {key_name}")
+        printd("stack management and constant key: {}", key_name)
         if key_name == "ENTER":
             push_stack()
-        if key_name == "CLR":
+            refresh_display = display_stale
+        elif key_name == "CLR":
             clr()
-        if key_name == "CLX":
+        elif key_name == "CLX":
             clr("x")
-        if key_name == "STO":
+        elif key_name == "STO":
             MEM = X_REG
-        if key_name == "RCL":
+            refresh_display = display_stale
+        elif key_name == "RCL":
             push_stack()
             X_REG = MEM
-        if key_name == "R":
+        elif key_name == "R":
             roll_stack()
-        if key_name == "x<>y":
-            temp = X_REG
-            X_REG = Y_REG
-            Y_REG = temp
-        if key_name == "π":
+        elif key_name == "x<>y":
+            X_REG, Y_REG = Y_REG, X_REG
+        elif key_name == "π":
             X_REG = PI
 
     # Monadic Operator Key Cluster: LOG, LN, e^x, √x, ARC, SIN, COS, ,TAN, 1/x
-    if key_name in (
-        "LOG",
-        "LN",
-        "e^x",
-        "√x",
-        "ARC",
-        "SIN",
-        "COS",
-        "TAN",
-        "1/x",
-    ):
+    if key_cluster == MONADIC:
         STATE = MONADIC
-        printd(f"monadic operator key: {key_name}")
+        printd("monadic operator key: {}", key_name)
         try:
-            getcontext().prec = INTERNAL_PRECISION
-            if key_name == "LOG":
-                X_REG = Decimal.log10(X_REG)
-            if key_name == "LN":
-                X_REG = Decimal.ln(X_REG)
-            if key_name == "e^x":
-                X_REG = Decimal.exp(X_REG)
-            if key_name == "√x":
-                X_REG = Decimal.sqrt(X_REG)
             if key_name == "ARC":
                 ARC_FLAG = True
-            if key_name == "SIN":
-                if ARC_FLAG:
-                    X_REG = convert_radians_to_degrees(Decimal.asin(X_REG))
-                else:
-                    X_REG = Decimal.sin(convert_degrees_to_radians(X_REG))
-                ARC_FLAG = False
-            if key_name == "COS":
+                refresh_display = display_stale
+            elif key_name in ("SIN", "COS", "TAN"):
+                if not TRIG_FUNCTIONS:
+                    load_trig_functions()
+                function, arc_function = TRIG_FUNCTIONS[key_name]
                 if ARC_FLAG:
-                    X_REG = convert_radians_to_degrees(Decimal.acos(X_REG))
+                    X_REG = convert_radians_to_degrees(arc_function(X_REG))
                 else:
-                    X_REG = Decimal.cos(convert_degrees_to_radians(X_REG))
+                    X_REG = function(convert_degrees_to_radians(X_REG))
                 ARC_FLAG = False
-            if key_name == "TAN":
-                if ARC_FLAG:
-                    X_REG = convert_radians_to_degrees(Decimal.atan(X_REG))
-                else:
-                    X_REG = Decimal.tan(convert_degrees_to_radians(X_REG))
-                ARC_FLAG = False
-            if key_name == "1/x":
-                X_REG = 1 / X_REG
+            else:
+                X_REG = MONADIC_FUNCTIONS[key_name](X_REG)
         except Exception as err:
             print("Exception:", err)
             display_error(str(type(err))[8:-2])
@@ -571,30 +597,14 @@ while True:
             display_error("InfiniteValue")
 
     # Dyadic Operator Key Cluster: x^y, -, +, *, ÷
-    if key_name in (
-        "x^y",
-        "-",
-        "+",
-        "*",
-        "÷",
-    ):
+    if key_cluster == DYADIC:
         STATE = DYADIC
-        printd(f"dyadic operator key: {key_name}")
+        printd("dyadic operator key: {}", key_name)
         try:
-            getcontext().prec = INTERNAL_PRECISION
             if key_name == "x^y":
                 X_REG = X_REG**Y_REG
-            if key_name == "-":
-                Y_REG = Y_REG - X_REG
-                pull_stack()
-            if key_name == "+":
-                Y_REG = Y_REG + X_REG
-                pull_stack()
-            if key_name == "*":
-                Y_REG = Y_REG * X_REG
-                pull_stack()
-            if key_name == "÷":
-                Y_REG = Y_REG / X_REG
+            else:
+                Y_REG = DYADIC_FUNCTIONS[key_name](Y_REG, X_REG)
                 pull_stack()
         except Exception as err:
             print("Exception:", err)
@@ -605,10 +615,13 @@ while True:
 
     if STATE not in ("C_ENTRY", "E_ENTRY", "ERROR"):
         STATE = IDLE
-        update_display_reg_from_x_reg()
-        gc.collect()  # Clean-up memory heap space
-        print_stack()
-        frame = time.monotonic() - t0
-        free_memory = gc.mem_free()
-        print(f"frame: {frame:5.02f}sec   free memory: {free_memory/1000:6.03f}kb")
-        print(f"Calculator STATE: {STATE}")
+        if refresh_display:
+            update_display_reg_from_x_reg()
+        if gc.mem_free() < GC_THRESHOLD:
+            gc.collect()  # Clean-up memory heap space
+        if DEBUG:
+            print_stack()
+            frame = time.monotonic() - t0
+            free_memory = gc.mem_free()
+            print(f"frame: {frame:5.02f}sec   free memory: {free_memory/1000:6.03f}kb")
+            print(f"Calculator STATE: {STATE}")
@@ -28,52 +28,46 @@ class Colors:
     WHITE = 0xA0A0A0
     OUTLINE = GRAY_DK
 
-    black_palette = displayio.Palette(1)
-    black_palette[0] = BLACK
-    gray_palette = displayio.Palette(1)
-    gray_palette[0] = GRAY
-    gray_dk_palette = displayio.Palette(1)
-    gray_dk_palette[0] = GRAY_DK
-
 
 # (x, y), (width, height), name, fill_color, outline_color, pressed_color
+# Dimensions in hundredths of a case unit; the case is 4.3 units high
 # object order: back to front
 HP_BUTTONS = [
-    ((0.20, 1.1), (0.26, 0.20), "x^y", Colors.BLACK, Colors.OUTLINE),
-    ((0.57, 1.1), (0.26, 0.20), "LOG", Colors.BLACK, Colors.OUTLINE),
-    ((0.96, 1.1), (0.26, 0.20), "LN", Colors.BLACK, Colors.OUTLINE),
-    ((1.33, 1.1), (0.26, 0.20), "e^x", Colors.BLACK, Colors.OUTLINE),
-    ((1.71, 1.1), (0.26, 0.20), "CLR", Colors.BLUE, Colors.OUTLINE),
-    ((0.20, 1.5), (0.26, 0.20), "√x", Colors.BLACK, Colors.OUTLINE),
-    ((0.57, 1.5), (0.26, 0.20), "ARC", Colors.BLACK, Colors.OUTLINE),
-    ((0.96, 1.5), (0.26, 0.20), "SIN", Colors.BLACK, Colors.OUTLINE),
-    ((1.33, 1.5), (0.26, 0.20), "COS", Colors.BLACK, Colors.OUTLINE),
-    ((1.71, 1.5), (0.26, 0.20), "TAN", Colors.BLACK, Colors.OUTLINE),
-    ((0.20, 1.9), (0.26, 0.20), "1/x", Colors.BLACK, Colors.OUTLINE),
-    ((0.57, 1.9), (0.26, 0.20), "x<>y", Colors.BLACK, Colors.OUTLINE),
-    ((0.96, 1.9), (0.26, 0.20), "R", Colors.BLACK, Colors.OUTLINE),
-    ((1.33, 1.9), (0.26, 0.20), "STO", Colors.BLACK, Colors.OUTLINE),
-    ((1.71, 1.9), (0.26, 0.20), "RCL", Colors.BLACK, Colors.OUTLINE),
-    ((0.20, 2.3), (0.62, 0.20), "ENTER", Colors.BLUE, Colors.OUTLINE),
-    ((0.96, 2.3), (0.26, 0.20), "CHS", Colors.BLUE, Colors.OUTLINE),
-    ((1.33, 2.3), (0.26, 0.20), "EEX", Colors.BLUE, Colors.OUTLINE),
-    ((1.71, 2.3), (0.26, 0.20), "CLX", Colors.BLUE, Colors.OUTLINE),
-    ((0.20, 2.7), (0.20, 0.20), "-", Colors.BLUE, Colors.OUTLINE),
-    ((0.59, 2.7), (0.30, 0.20), "7", Colors.WHITE, Colors.OUTLINE),
-    ((1.13, 2.7), (0.30, 0.20), "8", Colors.WHITE, Colors.OUTLINE),
-    ((1.67, 2.7), (0.30, 0.20), "9", Colors.WHITE, Colors.OUTLINE),
-    ((0.20, 3.1), (0.20, 0.20), "+", Colors.BLUE, Colors.OUTLINE),
-    ((0.59, 3.1), (0.30, 0.20), "4", Colors.WHITE, Colors.OUTLINE),
-    ((1.13, 3.1), (0.30, 0.20), "5", Colors.WHITE, Colors.OUTLINE),
-    ((1.67, 3.1), (0.30, 0.20), "6", Colors.WHITE, Colors.OUTLINE),
-    ((0.20, 3.5), (0.20, 0.20), "*", Colors.BLUE, Colors.OUTLINE),
-    ((0.59, 3.5), (0.30, 0.20), "1", Colors.WHITE, Colors.OUTLINE),
-    ((1.13, 3.5), (0.30, 0.20), "2", Colors.WHITE, Colors.OUTLINE),
-    ((1.67, 3.5), (0.30, 0.20), "3", Colors.WHITE, Colors.OUTLINE),
-    ((0.20, 3.9), (0.20, 0.20), "÷", Colors.BLUE, Colors.OUTLINE),
-    ((0.59, 3.9), (0.30, 0.20), "0", Colors.WHITE, Colors.OUTLINE),
-    ((1.13, 3.9), (0.30, 0.20), ".", Colors.WHITE, Colors.OUTLINE),
-    ((1.67, 3.9), (0.30, 0.20), "π", Colors.WHITE, Colors.OUTLINE),
+    ((20, 110), (26, 20), "x^y", Colors.BLACK, Colors.OUTLINE),
+    ((57, 110), (26, 20), "LOG", Colors.BLACK, Colors.OUTLINE),
+    ((96, 110), (26, 20), "LN", Colors.BLACK, Colors.OUTLINE),
+    ((133, 110), (26, 20), "e^x", Colors.BLACK, Colors.OUTLINE),
+    ((171, 110), (26, 20), "CLR", Colors.BLUE, Colors.OUTLINE),
+    ((20, 150), (26, 20), "√x", Colors.BLACK, Colors.OUTLINE),
+    ((57, 150), (26, 20), "ARC", Colors.BLACK, Colors.OUTLINE),
+    ((96, 150), (26, 20), "SIN", Colors.BLACK, Colors.OUTLINE),
+    ((133, 150), (26, 20), "COS", Colors.BLACK, Colors.OUTLINE),
+    ((171, 150), (26, 20), "TAN", Colors.BLACK, Colors.OUTLINE),
+    ((20, 190), (26, 20), "1/x", Colors.BLACK, Colors.OUTLINE),
+    ((57, 190), (26, 20), "x<>y", Colors.BLACK, Colors.OUTLINE),
+    ((96, 190), (26, 20), "R", Colors.BLACK, Colors.OUTLINE),
+    ((133, 190), (26, 20), "STO", Colors.BLACK, Colors.OUTLINE),
+    ((171, 190), (26, 20), "RCL", Colors.BLACK, Colors.OUTLINE),
+    ((20, 230), (62, 20), "ENTER", Colors.BLUE, Colors.OUTLINE),
+    ((96, 230), (26, 20), "CHS", Colors.BLUE, Colors.OUTLINE),
+    ((133, 230), (26, 20), "EEX", Colors.BLUE, Colors.OUTLINE),
+    ((171, 230), (26, 20), "CLX", Colors.BLUE, Colors.OUTLINE),
+    ((20, 270), (20, 20), "-", Colors.BLUE, Colors.OUTLINE),
+    ((59, 270), (30, 20), "7", Colors.WHITE, Colors.OUTLINE),
+    ((113, 270), (30, 20), "8", Colors.WHITE, Colors.OUTLINE),
+    ((167, 270), (30, 20), "9", Colors.WHITE, Colors.OUTLINE),
+    ((20, 310), (20, 20), "+", Colors.BLUE, Colors.OUTLINE),
+    ((59, 310), (30, 20), "4", Colors.WHITE, Colors.OUTLINE),
+    ((113, 310), (30, 20), "5", Colors.WHITE, Colors.OUTLINE),
+    ((167, 310), (30, 20), "6", Colors.WHITE, Colors.OUTLINE),
+    ((20, 350), (20, 20), "*", Colors.BLUE, Colors.OUTLINE),
+    ((59, 350), (30, 20), "1", Colors.WHITE, Colors.OUTLINE),
+    ((113, 350), (30, 20), "2", Colors.WHITE, Colors.OUTLINE),
+    ((167, 350), (30, 20), "3", Colors.WHITE, Colors.OUTLINE),
+    ((20, 390), (20, 20), "÷", Colors.BLUE, Colors.OUTLINE),
+    ((59, 390), (30, 20), "0", Colors.WHITE, Colors.OUTLINE),
+    ((113, 390), (30, 20), ".", Colors.WHITE, Colors.OUTLINE),
+    ((167, 390), (30, 20), "π", Colors.WHITE, Colors.OUTLINE),
 ]
 
 
@@ -86,13 +80,9 @@ class CalculatorButtons(displayio.Group):
         self._timeout = timeout
         self._click = click
         self._l_margin = l_margin
-        WIDTH = board.DISPLAY.width
-        HEIGHT = board.DISPLAY.height
-
-        # Create a simple indexed list of button names for button creation
-        self._button_names = []
-        for i in range(0, len(HP_BUTTONS)):
-            self._button_names.append(HP_BUTTONS[2])
+        display = board.DISPLAY
+        WIDTH = display.width
+        HEIGHT = display.height
 
         # Instantiate touch screen
         self.ts = adafruit_touchscreen.Touchscreen(
@@ -109,17 +99,16 @@ class CalculatorButtons(displayio.Group):
         self.FONT_0 = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
 
         # Build displayio button group
-        self._buttons = []
-        self._buttons_index = []  # The list of buttons used for detection
+        self._buttons = []  # The list of buttons used for detection
         button_group = displayio.Group()
 
         # Create the displayio button definitions
         for i in HP_BUTTONS:
             button = Button(
-                x=int(round(i[0][0] / 4.3 * HEIGHT, 0)) + self._l_margin,
-                y=int(round(i[0][1] / 4.3 * HEIGHT, 0)),
-                width=int(round(i[1][0] / 4.3 * HEIGHT, 0)),
-                height=int(round(i[1][1] / 4.3 * HEIGHT, 0)),
+                x=(i[0][0] * HEIGHT + 215) // 430 + l_margin,
+                y=(i[0][1] * HEIGHT + 215) // 430,
+                width=(i[1][0] * HEIGHT + 215) // 430,
+                height=(i[1][1] * HEIGHT + 215) // 430,
                 style=Button.RECT,
                 fill_color=i[3],
                 outline_color=i[4],
@@ -134,7 +123,6 @@ class CalculatorButtons(displayio.Group):
                 button.label_color = Colors.BLACK
             button_group.append(button)
             self._buttons.append(button)
-            self._buttons_index.append(button.name)
 
         super().__init__()
         self.append(button_group)
@@ -161,14 +149,14 @@ class CalculatorButtons(displayio.Group):
         hold_time = 0
         touch = self.ts.touch_point
         if touch:
-            for button in self._buttons:
+            for index, button in enumerate(self._buttons):
                 if button.contains(touch):
                     button.selected = True
                     if self._click:
                         # Make a click sound when button is pressed
                         tone(board.A0, 3000, 0.001, length=8)
                     button_pressed = button.name
-                    button_name = self._buttons_index.index(button_pressed)
+                    button_name = index
                     timeout_beep = False
                     while self.ts.touch_point:
                         time.sleep(0.1)
@@ -182,4 +170,5 @@ class CalculatorButtons(displayio.Group):
                     if self._click:
                         # Make a click sound when button is released
                         tone(board.A0, 3000, 0.001, length=8)
+                    break  # Buttons don't overlap; skip the rest of the scan
         return button_pressed, button_name, hold_time
@@ -32,15 +32,44 @@ class Colors:
 
 
 # (x, y), (width, height), name, fill_color
+# Dimensions in hundredths of a case unit; the case is 4.3 units high
 # object order: back to front
 HP_CASE = [
-    ((0.00, 0.00), (2.16, 0.70), "DISPLAY outline", Colors.gray_dk_palette),
-    ((0.00, 0.70), (2.16, 3.60), "KEYS outline", Colors.gray_palette),
-    ((0.45, 0.80), (0.30, 0.10), "PWR outline", Colors.gray_dk_palette),
-    ((0.60, 0.80), (0.15, 0.10), "PWR switch", Colors.black_palette),
-    ((0.08, 0.16), (2.00, 0.38), "DISPLAY area", Colors.black_palette),
+    ((0, 0), (216, 70), "DISPLAY outline", Colors.gray_dk_palette),
+    ((0, 70), (216, 360), "KEYS outline", Colors.gray_palette),
+    ((45, 80), (30, 10), "PWR outline", Colors.gray_dk_palette),
+    ((60, 80), (15, 10), "PWR switch", Colors.black_palette),
+    ((8, 16), (200, 38), "DISPLAY area", Colors.black_palette),
 ]
 
+# Scale the case geometry to pixels once at import. The case is drawn in
+# portrait orientation; the display may not be rotated yet, so use the long
+# axis for height.
+_WIDTH, _HEIGHT = sorted((board.DISPLAY.width, board.DISPLAY.height))
+
+
+def _to_pixels(hundredths):
+    """Convert hundredths of a case unit to rounded integer pixels."""
+    return (hundredths * _HEIGHT + 215) // 430
+
+
+L_MARGIN = (_WIDTH // 2) - (HP_CASE[0][1][0] * _HEIGHT + 430) // 860
+
+# x, y, width, height, fill_color
+HP_CASE_PX = [
+    (
+        _to_pixels(i[0][0]) + L_MARGIN,
+        _to_pixels(i[0][1]),
+        _to_pixels(i[1][0]),
+        _to_pixels(i[1][1]),
+        i[3],
+    )
+    for i in HP_CASE
+]
+
+STATUS_POSITION = (_WIDTH // 2, _to_pixels(62))
+PWR_TEXT_POSITION = (_to_pixels(20) + L_MARGIN, _to_pixels(HP_CASE[2][0][1]))
+
 
 class LEDDisplay(displayio.Group):
     def __init__(self, scale=1, display_color=0xFF0000):
@@ -62,7 +91,7 @@ class LEDDisplay(displayio.Group):
         )
         self._led_digits.anchor_point = (0, 0.5)
         self._led_digits.anchored_position = (
-            board.DISPLAY.width * 0.18 // _scale,
+            _WIDTH * 0.18 // _scale,
             40 // _scale,
         )
         led_display_group.append(self._led_digits)
@@ -77,7 +106,11 @@ class LEDDisplay(displayio.Group):
 
     @text.setter
     def text(self, text=""):
-        self._led_digits.text = text[0:15]
+        if len(text) > 15:
+            text = text[0:15]
+        # Skip the label rebuild if the displayed text is unchanged
+        if text != self._led_digits.text:
+            self._led_digits.text = text
         return
 
 
@@ -87,13 +120,7 @@ class CalculatorCase(displayio.Group):
         Builds the displayio button group."""
 
         self._visible = visible
-
-        WIDTH = board.DISPLAY.width
-        HEIGHT = board.DISPLAY.height
-
-        self._l_margin = (WIDTH // 2) - int(
-            round(HP_CASE[0][1][0] / 4.3 * HEIGHT / 2, 0)
-        )
+        self._l_margin = L_MARGIN
 
         FONT_1 = bitmap_font.load_font("/fonts/OpenSans-9.bdf")
 
@@ -102,13 +129,9 @@ class CalculatorCase(displayio.Group):
 
         if self._visible:
 
-            for i in HP_CASE:
+            for x, y, width, height, palette in HP_CASE_PX:
                 case_element = vectorio.Rectangle(
-                    pixel_shader=i[3],
-                    x=int(round(i[0][0] / 4.3 * HEIGHT, 0)) + self._l_margin,
-                    y=int(round(i[0][1] / 4.3 * HEIGHT, 0)),
-                    width=int(round(i[1][0] / 4.3 * HEIGHT, 0)),
-                    height=int(round(i[1][1] / 4.3 * HEIGHT, 0)),
+                    pixel_shader=palette, x=x, y=y, width=width, height=height
                 )
                 case_group.append(case_element)
 
@@ -119,10 +142,7 @@ class CalculatorCase(displayio.Group):
                 color=None,
             )
             self._status.anchor_point = (0.5, 0.5)
-            self._status.anchored_position = (
-                WIDTH // 2,
-                int(round(0.62 / 4.3 * HEIGHT, 0)),
-            )
+            self._status.anchored_position = STATUS_POSITION
             case_group.append(self._status)
 
             # Power switch label
@@ -132,10 +152,7 @@ class CalculatorCase(displayio.Group):
                 color=Colors.BLACK,
             )
             pwr_text.anchor_point = (0, 0)
-            pwr_text.anchored_position = (
-                int(round(0.20 / 4.3 * HEIGHT, 0)) + self._l_margin,
-                int(round(HP_CASE[2][0][1] / 4.3 * HEIGHT, 0)),
-            )
+            pwr_text.anchored_position = PWR_TEXT_POSITION
             case_group.append(pwr_text)
 
         super().__init__()
@@ -149,10 +166,12 @@ class CalculatorCase(displayio.Group):
 
     @property
     def status(self):
-        """Status message text."""
+        """Status message label."""
         return self._status
 
     @status.setter
     def status(self, text=""):
-        self._status = text
+        """Set the status message label text."""
+        if text != self._status.text:
+            self._status.text = text
         return
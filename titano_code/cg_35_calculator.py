@@ -61,7 +61,7 @@ gc.collect()  # Clean-up memory heap space
 
 from cedargrove_calculator.buttons import CalculatorButtons
 from cedargrove_calculator.case import CalculatorCase, LEDDisplay, Colors
-from jepler_udecimal import Decimal, getcontext, setcontext, localcontext, ROUND_HALF_UP
+from jepler_udecimal import Decimal, getcontext, ROUND_HALF_UP
 import jepler_udecimal.utrig  # Needed for trig functions in Decimal
 
 # User-modifiable parameters
@@ -83,6 +83,7 @@ ERROR = "ERROR"  # Calculation error
 STATE = IDLE  # Set initial state to IDLE
 
 # Constants
+ZERO = Decimal("0")
 PI = Decimal(1).atan() * 4  # Alternative: PI = Decimal("3.141592654")
 
 t0 = time.monotonic()  # Reset start-up time counter
@@ -112,7 +113,7 @@ getcontext().Emin = -99
 # Initiate the display, memory, and stack
 DISPLAY_C = " 0."
 DISPLAY_E = " 00"
-X_REG = Y_REG = Z_REG = T_REG = MEM = Decimal("0")
+X_REG = Y_REG = Z_REG = T_REG = MEM = ZERO
 
 # Add the case, bubble display, and button displayio layers
 calculator.append(case_group)
@@ -134,13 +135,13 @@ def clr(register=None):
         # Clear display, stack registers, memory, and reset ARC flag
         DISPLAY_C = " 0."
         DISPLAY_E = " 00"
-        X_REG = Y_REG = Z_REG = T_REG = MEM = Decimal("0")
+        X_REG = Y_REG = Z_REG = T_REG = MEM = ZERO
         ARC_FLAG = False
     elif register == "x":
         # Clear display and X_REG
         DISPLAY_C = " 0."
         DISPLAY_E = " 00"
-        X_REG = Decimal("0")
+        X_REG = ZERO
     else:
         return False  # No register specified
     return True
@@ -170,7 +171,7 @@ def pull_stack():
     X_REG = Y_REG
     Y_REG = Z_REG
     Z_REG = T_REG
-    T_REG = Decimal("0")
+    T_REG = ZERO
     return
 
 
@@ -198,16 +199,14 @@ def convert_display_to_decimal(coefficient=" 0.", exponent="   "):
         sign = "+"
 
     # Clean up and reformat coefficient; remove spaces, put zero before dp if dp is in first position
-    while coefficient.find(" ") >= 0:
-        coefficient = coefficient.split(" ", 1)[0] + coefficient.split(" ", 1)[1]
+    coefficient = coefficient.replace(" ", "")
     if coefficient[0] == ".":
         coefficient = "0" + coefficient
     # Pad coefficient with trailing zeros for values with positive exponent
     for i in range(len(coefficient), getcontext().prec + 1):
         coefficient = coefficient + "0"
     # Clean up and reformat exponent; remove spaces, set to zero if blank, add separator E character
-    while exponent.find(" ") >= 0:
-        exponent = exponent.split(" ", 1)[0] + exponent.split(" ", 1)[1]
+    exponent = exponent.replace(" ", "")
     if exponent == "":
         exponent = "0"
     exponent = "E" + str(int(exponent))
@@ -221,7 +220,7 @@ def convert_display_to_decimal(coefficient=" 0.", exponent="   "):
     return new_value
 
 
-def convert_decimal_to_display(value=Decimal("0")):
+def convert_decimal_to_display(value=ZERO):
     """Convert a Decimal value into the equivalent display text."""
     # Round to display precision and convert to string
     printd(f"decimal_to_display value input: '{value}'  type: {type(value)}")
@@ -230,7 +229,7 @@ def convert_decimal_to_display(value=Decimal("0")):
         getcontext().prec = DISPLAY_PRECISION
         value = value / 1
     else:
-        value = Decimal(0)
+        value = ZERO
     decimal_text = str(value)
 
     # Separate coefficient from exponent
@@ -255,13 +254,12 @@ def convert_decimal_to_display(value=Decimal("0")):
         coefficient = coefficient + "."
 
     # Remove leading zeros except at start of digit entry
-    if coefficient[1:] != "0.":
-        while coefficient.find(".") > 1 and coefficient[1] == "0":
-            coefficient = coefficient[0] + coefficient[2:]
+    if coefficient[1:] != "0." and "." in coefficient:
+        coefficient = coefficient[0] + coefficient[1:].lstrip("0")
 
     # Remove trailing zeros from coefficient
-    while coefficient.find(".") <= 12 and coefficient[-1] == "0":
-        coefficient = coefficient[0:-1]
+    if "." in coefficient:
+        coefficient = coefficient.rstrip("0")
 
     # Don't display a minus zero coefficient
     if coefficient == "-0.":
@@ -279,10 +277,9 @@ def convert_decimal_to_display(value=Decimal("0")):
 
 def print_stack():
     """Print stack registers and auxillary memory in REPL."""
+    coefficient, exponent = convert_decimal_to_display(X_REG)
     print(f"-" * 48)
-    print(
-        f"D.X_REG:  {X_REG}  DISPLAY: '{convert_decimal_to_display(X_REG)[0] + convert_decimal_to_display(X_REG)[1]}'"
-    )
+    print(f"D.X_REG:  {X_REG}  DISPLAY: '{coefficient + exponent}'")
     print(f"D.Y_REG:  {Y_REG}")
     print(f"D.Z_REG:  {Z_REG}")
     print(f"D.T_REG:  {T_REG}")
@@ -299,8 +296,7 @@ def show_display_reg():
     if exponent[1:3] == "00":
         exponent = "   "
     # If needed, pad coefficient with spaces
-    coefficient = coefficient + (" " * (12 - len(coefficient)))
-    led_display.text = coefficient + exponent
+    led_display.text = "{:<12}{}".format(coefficient, exponent)
     return
 
 
@@ -345,8 +341,7 @@ def update_display_reg_from_x_reg():
     DISPLAY_C = coefficient
     DISPLAY_E = exponent
     # If needed, pad coefficient with spaces
-    coefficient = coefficient + (" " * (12 - len(coefficient)))
-    led_display.text = coefficient + exponent
+    led_display.text = "{:<12}{}".format(coefficient, exponent)
     return
 
 